@@ -1,5 +1,9 @@
 import atexit
+import functools
+import os
+import sys
 
+import lark_cython
 from berkeleydb import db
 from lark import Lark, exceptions
 
@@ -7,72 +11,138 @@ from src.executor import SQLExecutor
 from src.literals import PROMPT_TEXT
 
 
-def read_query_input():
-    # Read a query input from user, which can be multi-lines or multi-queries
+def read_query_inputs(stream=sys.stdin):
+    # Read query inputs from user one by one, each of which can be multi-lines or multi-queries
+    # Note: Iterating the stream reads the lines through its buffer, instead of calling `input()` per line
     query_input_lines = []
-    while True:
-        query_input_line = input().strip()
+    for query_input_line in stream:
+        query_input_line = query_input_line.strip()
         query_input_lines.append(query_input_line)
 
         # Stop reading lines for current input, when encountering semicolon character at the end of the line
         if query_input_line.endswith(';'):
-            break
+            # Concatenate each line of the input with whitespace character, resulting in a cleaned query input
+            yield ' '.join(query_input_lines)
+            query_input_lines = []
 
-    # Concatenate each line of the input with whitespace character, resulting in a cleaned query input
-    return ' '.join(query_input_lines)
 
+def iter_queries(query_input):
+    # Yield each query ending with semicolon character, by scanning the query input (without building a list)
+    start = 0
+    end = query_input.find(';')
+    while end != -1:
+        yield query_input[start:end + 1]
+        start = end + 1
+        end = query_input.find(';', start)
 
-def parse_query_input(parser, executor, query_input):
-    # Split the query input into multiple queries, where each query ends with semicolon character
-    query_list = map(lambda query: query + ';', query_input[:-1].split(';'))
-
-    # For each query
-    for query in query_list:
-        # Parse the query, and make a tree representing the parsed result as hierarchical nodes
-        try:
-            tree = parser.parse(query)
 
-        # When parsing failed, print `Syntax error` and skip the remaining queries
-        except exceptions.UnexpectedInput:
-            print(f'{PROMPT_TEXT}> Syntax error')
-            break
+@functools.lru_cache(maxsize=256)
+def parse_query(parser, query):
+    # Parse the query, and make a tree representing the parsed result as hierarchical nodes
+    # Note: The trees are cached, since the same queries are often repeated verbatim (e.g. in scripts)
+    return parser.parse(query)
 
-        # When parsing is successful, validate and execute the query
-        try:
-            executor.execute(tree)
 
-        # When the query is invalid, print the error message
-        except exceptions.VisitError as e:
-            print(f'{PROMPT_TEXT}> {e.orig_exc}')
+def parse_query_input(env, parser, executor, query_input):
+    # Split the query input into multiple queries, where each query ends with semicolon character
+    # Note: Blank queries (e.g. from stray semicolons) are skipped
+    query_list = (query for query in iter_queries(query_input) if query[:-1].strip())
+
+    # Execute all the queries within a single transaction, for amortizing the commit cost over the query input
+    txn = env.txn_begin()
+    try:
+        # For each query
+        for query in query_list:
+            # Fast path for `EXIT` query, which does not need to be parsed
+            if query[:-1].strip().upper() == 'EXIT':
+                executor.exit_query(None)
+
+            # Parse the query
+            try:
+                tree = parse_query(parser, query)
+
+            # When parsing failed, print `Syntax error` and skip the remaining queries
+            except exceptions.UnexpectedInput:
+                print(f'{PROMPT_TEXT}> Syntax error')
+                break
+
+            # When parsing is successful, validate and execute the query (within a nested transaction)
+            query_txn = env.txn_begin(txn)
+            try:
+                executor.execute(tree, txn=query_txn)
+
+            # When the query is invalid, roll back only the query and print the error message
+            except Exception as e:
+                query_txn.abort()
+                executor.db_manager.clear_cache()
+                print(f'{PROMPT_TEXT}> {e}')
+
+            else:
+                query_txn.commit()
+
+    # Commit the transaction even if this process is terminated by `EXIT` query
+    finally:
+        txn.commit()
 
 
 def cleanup():
     # Reclaim memory resources before terminating this process
     database.close()
+    env.txn_checkpoint()  # Bound the recovery time of the next launch
+    env.close()
     grammar.close()
 
 
 # Register a cleanup function, which will be called when this process is terminated
 atexit.register(cleanup)
 
+# Buffer the standard output by blocks even on a terminal, instead of writing every line
+# Note: The output is flushed whenever prompting for the next query input, and when this process is terminated
+sys.stdout.reconfigure(line_buffering=False)
+atexit.register(sys.stdout.flush)
+
+# Open the database environment supporting transactions (Create if no environment exists)
+# Note: The transaction log is written without synchronous flushes (Durability is traded for commit latency)
+# Note: The environment is recovered on every launch, in case the previous process crashed before `cleanup()`
+env = db.DBEnv()
+env.set_cachesize(0, 64 * 1024 * 1024, 1)
+env.set_flags(db.DB_TXN_WRITE_NOSYNC, 1)
+env.log_set_config(db.DB_LOG_AUTO_REMOVE, 1)  # Remove the log files no longer needed, instead of keeping all of them
+env.open('.', db.DB_CREATE | db.DB_RECOVER | db.DB_INIT_TXN | db.DB_INIT_MPOOL | db.DB_INIT_LOCK | db.DB_INIT_LOG)
+
 # Open the database stored in local file system (Create if no database exists)
-database = db.DB()
-database.open('myDB.db', dbtype=db.DB_HASH, flags=db.DB_CREATE)
+database = db.DB(env)
+database.open('myDB.db', dbtype=db.DB_HASH, flags=db.DB_CREATE | db.DB_AUTO_COMMIT)
 
 # Instantiate a SQL parser from a lark file, which defines the grammar for parsing SQL
+# Note: The lexer/parser are compiled by Cython, which yields tokens that are not `str` (Use `token.value` instead)
+# Note: The compiled parser is cached in a local file, which is rebuilt automatically whenever the grammar changes
 grammar = open('grammar.lark')
-parser = Lark(grammar.read(), start='command', lexer='basic')
+parser = Lark(grammar.read(), start='command', parser='lalr', lexer='basic', cache='.lark_cache.bin',
+              _plugins=lark_cython.plugins)
 
 # Instantiate a SQL executor for handling each type of query
 executor = SQLExecutor(database)
 
-# Keep reading query inputs from user, before encountering `EXIT` query
-while True:
-    # Prompt for a query input
-    print(f'{PROMPT_TEXT}>', end=' ')
+# Prompt for a query input
+print(f'{PROMPT_TEXT}>', end=' ', flush=True)
+
+# Keep reading query inputs from user, before encountering `EXIT` query (or the end of the input)
+try:
+    for query_input in read_query_inputs():
+        # Parse the query input, and execute the queries
+        parse_query_input(env, parser, executor, query_input)
+
+        # Prompt for the next query input
+        print(f'{PROMPT_TEXT}>', end=' ', flush=True)
 
-    # Read a query input from user
-    query_input = read_query_input()
+# `EXIT` query raises `SystemExit`, after the transaction of the query input is committed
+except SystemExit:
+    pass
 
-    # Parse the query input, and execute the queries
-    parse_query_input(parser, executor, query_input)
+# Terminate this process immediately, skipping the teardown of the interpreter (e.g. freeing every cached table)
+# Note: The cleanup is performed in advance, since `os._exit()` does not call the registered cleanup functions
+atexit.unregister(cleanup)
+cleanup()
+sys.stdout.flush()
+os._exit(0)
@@ -1,20 +1,181 @@
-import json
+import msgspec
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+_json_encoder = msgspec.json.Encoder()
+_json_decoder = msgspec.json.Decoder()
 
 
 class DatabaseManager:
     ENCODING = 'UTF-8'
+    LOG_SEPARATOR = b'\x00'  # Never appears in the table names (See `IDENTIFIER` token in the grammar)
+    LOG_LIMIT = 256  # The number of the appended records, before they are merged into the table
 
     def __init__(self, database):
         self.database = database
 
-    def get_table_names(self):
-        return list(map(lambda key: key.decode(self.ENCODING), self.database.keys()))
+        # Write-through caches (The database is opened exclusively by this process, so they are always coherent)
+        self._cache = {}
+        self._table_names = None
+        self._referring_table_names = None  # Reverse index of the foreign keys (referred table -> referring tables)
+
+        # The number of the records appended to each table, each of which is stored under its own key (See `append_record()`)
+        self._log_sizes = {}
+
+        # Memoize the encoded keys, since the same table names are repeated across the queries
+        self._keys = {}
+
+    def _key(self, table_name):
+        key = self._keys.get(table_name)
+        if key is None:
+            key = self._keys[table_name] = table_name.encode(self.ENCODING)
+
+        return key
+
+    def _log_key(self, table_name, idx):
+        return self._key(table_name) + self.LOG_SEPARATOR + str(idx).encode(self.ENCODING)
+
+    @staticmethod
+    def _upgrade_columns(data):
+        # Fill in the pre-parsed type fields, for the tables created before they were introduced
+        for column in data['columns']:
+            if 'type_kind' not in column:
+                column['type_kind'] = column['type'][:4]
+                column['char_len'] = int(column['type'][5:-1]) if column['type_kind'] == 'char' else None
+
+        return data
+
+    @staticmethod
+    def _encode(data):
+        try:
+            return _encoder.encode(data)
+
+        # Fall back to JSON format, when some `int` value exceeds the range of MessagePack (64 bits)
+        except OverflowError:
+            return _json_encoder.encode(data)
+
+    @staticmethod
+    def _decode(value):
+        try:
+            return _decoder.decode(value)
+        except msgspec.DecodeError:
+            return _json_decoder.decode(value)
+
+    def clear_cache(self):
+        # Must be called whenever a transaction is aborted, since the caches may hold the rolled back writes
+        self._cache = {}
+        self._table_names = None
+        self._referring_table_names = None
+        self._log_sizes = {}
+
+    def _load_table_names(self, txn=None):
+        # Keep the table names in an insertion-ordered dictionary, which serves both as a list and as a set
+        if self._table_names is None:
+            self._table_names = dict.fromkeys(
+                key.decode(self.ENCODING) for key in self.database.keys(txn) if self.LOG_SEPARATOR not in key
+            )
+
+        return self._table_names
+
+    def get_table_names(self, txn=None):
+        return list(self._load_table_names(txn))
+
+    def has_table(self, table_name, txn=None):
+        return table_name in self._cache or table_name in self._load_table_names(txn)
+
+    def _load_referring_table_names(self, txn=None):
+        # Build the reverse index of the foreign keys only once, and keep it up to date on every table creation/drop
+        if self._referring_table_names is None:
+            self._referring_table_names = {}
+            for table_name in self._load_table_names(txn):
+                self._index_foreign_keys(table_name, self.get_table(table_name, txn=txn))
+
+        return self._referring_table_names
+
+    def _index_foreign_keys(self, table_name, data):
+        for column in data['columns']:
+            if column['foreign']:
+                self._referring_table_names.setdefault(column['foreign']['table_name'], set()).add(table_name)
+
+    def get_referring_table_names(self, table_name, txn=None):
+        return set(self._load_referring_table_names(txn).get(table_name, ()))
+
+    def get_table(self, table_name, txn=None):
+        if table_name in self._cache:
+            return self._cache[table_name]
+
+        key = self._key(table_name)
+        value = self.database.get(key, txn=txn)
+
+        try:
+            data = _decoder.decode(value)
+
+        # Migrate the table stored in the legacy JSON format into MessagePack format (Only once per table)
+        except msgspec.DecodeError:
+            data = _json_decoder.decode(value)
+            try:
+                self.database.put(key, _encoder.encode(data), txn=txn)
+
+            # Keep the table in JSON format, when some `int` value exceeds the range of MessagePack (See `_encode()`)
+            except OverflowError:
+                pass
+
+        # Restore the appended records, which are not merged into the table yet
+        column_names = [column['name'] for column in data['columns']]
+        log_size = 0
+        value = self.database.get(self._log_key(table_name, log_size), txn=txn)
+        while value is not None:
+            data['records'].append(dict(zip(column_names, self._decode(value))))
+            log_size += 1
+            value = self.database.get(self._log_key(table_name, log_size), txn=txn)
+
+        self._log_sizes[table_name] = log_size
+        self._cache[table_name] = self._upgrade_columns(data)
+        return data
+
+    def set_table(self, table_name, data, txn=None):
+        if table_name not in self._cache:
+            self._table_names = None
+
+            # The columns of a table never change after its creation, so only a new table needs to be indexed
+            if self._referring_table_names is not None:
+                self._index_foreign_keys(table_name, data)
+
+        self._cache[table_name] = data
+        self.database.put(self._key(table_name), self._encode(data), txn=txn)
+
+        # The appended records are merged into the table from now on
+        for idx in range(self._log_sizes.get(table_name, 0)):
+            self.database.delete(self._log_key(table_name, idx), txn=txn)
+        self._log_sizes[table_name] = 0
+
+    def append_record(self, table_name, record, txn=None):
+        # Write only the appended record, instead of the whole table (The table must have been loaded)
+        data = self._cache[table_name]
+        data['records'].append(record)
+
+        log_size = self._log_sizes[table_name]
+        if log_size >= self.LOG_LIMIT:
+            self.set_table(table_name, data, txn=txn)
+            return
 
-    def get_table(self, table_name):
-        return json.loads(self.database.get(table_name.encode(self.ENCODING)).decode(self.ENCODING))
+        self.database.put(
+            self._log_key(table_name, log_size),
+            self._encode([record[column['name']] for column in data['columns']]),
+            txn=txn
+        )
+        self._log_sizes[table_name] = log_size + 1
 
-    def set_table(self, table_name, data):
-        self.database.put(table_name.encode(self.ENCODING), json.dumps(data).encode(self.ENCODING))
+    def delete_table(self, table_name, txn=None):
+        # Load the table if not loaded, for finding out the number of the appended records
+        self.get_table(table_name, txn=txn)
+        for idx in range(self._log_sizes.pop(table_name)):
+            self.database.delete(self._log_key(table_name, idx), txn=txn)
 
-    def delete_table(self, table_name):
-        self.database.delete(table_name.encode(self.ENCODING))
+        self._cache.pop(table_name, None)
+        self._table_names = None
+        if self._referring_table_names is not None:
+            self._referring_table_names.pop(table_name, None)
+            for referring_table_name_set in self._referring_table_names.values():
+                referring_table_name_set.discard(table_name)
+        self.database.delete(self._key(table_name), txn=txn)
@@ -1,103 +1,175 @@
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def format_message(template, value):
+    # Reuse the same message for repeated errors with the same argument
+    return template.format(value)
+
+
 class DuplicateColumnDefError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: column definition is duplicated'
+
     def __init__(self):
-        super().__init__('Create table has failed: column definition is duplicated')
+        super().__init__(self.MESSAGE)
 
 
 class DuplicatePrimaryKeyDefError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: primary key definition is duplicated'
+
     def __init__(self):
-        super().__init__('Create table has failed: primary key definition is duplicated')
+        super().__init__(self.MESSAGE)
 
 
 class ReferenceTypeError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: foreign key references wrong type'
+
     def __init__(self):
-        super().__init__('Create table has failed: foreign key references wrong type')
+        super().__init__(self.MESSAGE)
 
 
 class ReferenceNonPrimaryKeyError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: foreign key references non primary key column'
+
     def __init__(self):
-        super().__init__('Create table has failed: foreign key references non primary key column')
+        super().__init__(self.MESSAGE)
 
 
 class ReferenceColumnExistenceError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: foreign key references non existing column'
+
     def __init__(self):
-        super().__init__('Create table has failed: foreign key references non existing column')
+        super().__init__(self.MESSAGE)
 
 
 class ReferenceTableExistenceError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: foreign key references non existing table'
+
     def __init__(self):
-        super().__init__('Create table has failed: foreign key references non existing table')
+        super().__init__(self.MESSAGE)
 
 
 class NonExistingColumnDefError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: \'{}\' does not exist in column definition'
+
     def __init__(self, column_name):
-        super().__init__(f'Create table has failed: \'{column_name}\' does not exist in column definition')
+        super().__init__(format_message(self.MESSAGE, column_name))
 
 
 class TableExistenceError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Create table has failed: table with the same name already exists'
+
     def __init__(self):
-        super().__init__('Create table has failed: table with the same name already exists')
+        super().__init__(self.MESSAGE)
 
 
 class CharLengthError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Char length should be over 0'
+
     def __init__(self):
-        super().__init__('Char length should be over 0')
+        super().__init__(self.MESSAGE)
 
 
 class NoSuchTable(Exception):
+    __slots__ = ()
+    MESSAGE = 'No such table'
+
     def __init__(self):
-        super().__init__('No such table')
+        super().__init__(self.MESSAGE)
 
 
 class DropReferencedTableError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Drop table has failed: \'{}\' is referenced by other table'
+
     def __init__(self, table_name):
-        super().__init__(f'Drop table has failed: \'{table_name}\' is referenced by other table')
+        super().__init__(format_message(self.MESSAGE, table_name))
 
 
 class SelectTableExistenceError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Selection has failed: \'{}\' does not exist'
+
     def __init__(self, table_name):
-        super().__init__(f'Selection has failed: \'{table_name}\' does not exist')
+        super().__init__(format_message(self.MESSAGE, table_name))
 
 
 class InsertTypeMismatchError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Insertion has failed: Types are not matched'
+
     def __init__(self):
-        super().__init__('Insertion has failed: Types are not matched')
+        super().__init__(self.MESSAGE)
 
 
 class InsertColumnExistenceError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Insertion has failed: \'{}\' does not exist'
+
     def __init__(self, column_name):
-        super().__init__(f'Insertion has failed: \'{column_name}\' does not exist')
+        super().__init__(format_message(self.MESSAGE, column_name))
 
 
 class InsertColumnNonNullableError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Insertion has failed: \'{}\' is not nullable'
+
     def __init__(self, column_name):
-        super().__init__(f'Insertion has failed: \'{column_name}\' is not nullable')
+        super().__init__(format_message(self.MESSAGE, column_name))
 
 
 class SelectColumnResolveError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Selection has failed: fail to resolve \'{}\''
+
     def __init__(self, column_name):
-        super().__init__(f'Selection has failed: fail to resolve \'{column_name}\'')
+        super().__init__(format_message(self.MESSAGE, column_name))
 
 
 class WhereIncomparableError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Where clause trying to compare incomparable values'
+
     def __init__(self):
-        super().__init__('Where clause trying to compare incomparable values')
+        super().__init__(self.MESSAGE)
 
 
 class WhereTableNotSpecified(Exception):
+    __slots__ = ()
+    MESSAGE = 'Where clause trying to reference tables which are not specified'
+
     def __init__(self):
-        super().__init__('Where clause trying to reference tables which are not specified')
+        super().__init__(self.MESSAGE)
 
 
 class WhereColumnNotExist(Exception):
+    __slots__ = ()
+    MESSAGE = 'Where clause trying to reference non existing column'
+
     def __init__(self):
-        super().__init__('Where clause trying to reference non existing column')
+        super().__init__(self.MESSAGE)
 
 
 class WhereAmbiguousReference(Exception):
+    __slots__ = ()
+    MESSAGE = 'Where clause contains ambiguous reference'
+
     def __init__(self):
-        super().__init__('Where clause contains ambiguous reference')
+        super().__init__(self.MESSAGE)
 
 
 class EtcError(Exception):
+    __slots__ = ()
+    MESSAGE = 'Etc error'
+
     def __init__(self):
-        super().__init__('Etc error')
+        super().__init__(self.MESSAGE)
@@ -1,8 +1,14 @@
+import ast
+import functools
 import itertools
+import operator
 import re
+import sys
 from datetime import datetime, date
 
-from lark import Transformer, Tree
+import numpy as np
+from lark import Tree
+from lark.visitors import Interpreter
 
 from src import exceptions
 from src.database import DatabaseManager
@@ -15,16 +21,20 @@ The structure of the data stored in Berkeley DB is as follows.
     columns: {
         name: string,
         type: string,
+        type_kind: 'int' | 'char' | 'date',
+        char_len: int | None,
         null: boolean,
         primary: boolean,
         foreign: { table_name: string, column_name: string } | None
     }[],
     records: { [column_name]: int | string }[]
 }
+
+Note: The inserted records are stored under separate keys (`[table_name]\\x00[idx]`) until they are merged into the table
 """
 
 
-class SQLExecutor(Transformer):
+class SQLExecutor(Interpreter):
     WIDTH_PADDING = 2
     OPERATION_MAP = {
         '=': '==',
@@ -36,17 +46,42 @@ class SQLExecutor(Transformer):
         'is null': 'is None',
         'is not null': 'is not None'
     }  # Mapping SQL operations to Python operations
-
-    def __init__(self, database):
+    OPERATOR_MAP = {
+        '=': operator.eq,
+        '!=': operator.ne,
+        '>': operator.gt,
+        '>=': operator.ge,
+        '<': operator.lt,
+        '<=': operator.le
+    }  # Mapping SQL operations to Python operators (applicable to NumPy arrays)
+    DISPLAY_FORMATTER_MAP = {
+        'int': lambda value: 'null' if value is None else str(value),
+        'char': lambda value: 'null' if value is None else value,
+        'date': lambda value: 'null' if value is None else value.strftime('%Y-%m-%d')
+    }  # Mapping SQL data types to the functions getting the display strings of the values
+    DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    INT64_MIN, INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)  # The range of `int` NumPy arrays
+
+    def __init__(self, database, out=None):
         super().__init__()
         self.db_manager = DatabaseManager(database)
 
-    def execute(self, tree):
+        # The writer for the results, which is chosen only once (The standard output by default)
+        self.out = sys.stdout if out is None else out
+        self.txn = None  # The transaction that the query being executed belongs to
+
+    def execute(self, tree, txn=None):
         """
-        Rename `transform` method for improving readability
+        Rename `visit` method for improving readability
+        The tree is interpreted top-down, so that only the visited query node is handled (without rebuilding the tree)
+        Every database access while executing the query is performed within `txn` transaction (if given)
         """
 
-        self.transform(tree)
+        self.txn = txn
+        try:
+            self.visit(tree)
+        finally:
+            self.txn = None
 
     @classmethod
     def parse_value(cls, value):
@@ -67,17 +102,39 @@ class SQLExecutor(Transformer):
                 parsed_value = int(value)
             except ValueError:
                 # date
-                if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+                if cls.DATE_PATTERN.match(value):
                     parsed_type = 'date'
-                    parsed_value = datetime.strptime(value, '%Y-%m-%d').date()
+                    parsed_value = cls.parse_date(value)
 
                 # char
                 else:
                     parsed_type = 'char'
-                    parsed_value = eval(value)
+                    parsed_value = cls.parse_char(value)
 
         return parsed_type, parsed_value
 
+    @classmethod
+    def parse_char(cls, value):
+        """
+        Parse a quoted string literal (either `'...'` or `"..."`) into a Python string
+        """
+
+        # Just strip the quotes, unless the string contains escape sequences
+        if '\\' not in value:
+            return value[1:-1]
+
+        return ast.literal_eval(value)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def parse_date(cls, value):
+        """
+        Parse a date string (`YYYY-MM-DD`) into a Python date
+        The results are cached, since the same dates are usually repeated over the records
+        """
+
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
     @classmethod
     def parse_predicate(cls, tree):
         """
@@ -92,22 +149,13 @@ class SQLExecutor(Transformer):
 
             return {
                 'leaf': True,
-                'operation': tree.children[1].children[0],
+                'operation': tree.children[1].children[0].value,
                 'operands': [
                     {
-                        'type': 'value' if len(operand1.children) == 1 else 'column',
-                        'expr': (
-                            cls.parse_value(operand1.children[0].children[0])[1] if len(operand1.children) == 1 else
-                            '.'.join([child.children[0].lower() for child in filter(None, operand1.children)])
-                        )
-                    },
-                    {
-                        'type': 'value' if len(operand2.children) == 1 else 'column',
-                        'expr': (
-                            cls.parse_value(operand2.children[0].children[0])[1] if len(operand2.children) == 1 else
-                            '.'.join([child.children[0].lower() for child in filter(None, operand2.children)])
-                        )
-                    }
+                        'type': 'value',
+                        'expr': cls.parse_value(operand.children[0].children[0].value)[1]
+                    } if len(operand.children) == 1 else cls.parse_column_operand(operand.children)
+                    for operand in (operand1, operand2)
                 ]
             }
 
@@ -115,54 +163,128 @@ class SQLExecutor(Transformer):
         if tree.data == 'null_predicate':
             return {
                 'leaf': True,
-                'operation': ' '.join([child.lower() for child in filter(None, tree.children[2].children)]),
-                'operands': [{
-                    'type': 'column',
-                    'expr': '.'.join([child.children[0].lower() for child in filter(None, tree.children[:2])])
-                }]
+                'operation': ' '.join([child.value.lower() for child in filter(None, tree.children[2].children)]),
+                'operands': [cls.parse_column_operand(tree.children[:2])]
             }
 
+    @classmethod
+    def parse_column_operand(cls, children):
+        """
+        Parse a column operand from the (optional) `table_name` node and the `column_name` node
+        Along with the column expression, keep its parts (`(table_name | None, column_name)`) for avoiding re-splitting it
+        """
+
+        name_list = [child.children[0].value.lower() for child in filter(None, children)]
+
+        return {
+            'type': 'column',
+            'expr': '.'.join(name_list),
+            'expr_parts': tuple(name_list) if len(name_list) == 2 else (None, name_list[0])
+        }
+
+    @classmethod
+    def resolve_column_expr(cls, operand, meta):
+        """
+        Resolve a column operand into its full column expression (`table_name.column_name`), assuming it is validated
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        table_name, column_name = operand['expr_parts']
+
+        # When the table name is not specified
+        if table_name is None:
+            return f'{meta["available_column_name_dict"][column_name][0]}.{column_name}'
+
+        return operand['expr']
+
     @classmethod
     def parse_condition(cls, tree):
         """
         Parse a condition node recursively and return the parsed result
-        The recursion starts with a `boolean_expr` node
+        The recursion starts with a `boolean_expr` node, and each type of node is handled by `CONDITION_PARSER_MAP`
         """
 
         # Exclude `None` from the children
-        children = list(filter(None, tree.children))
+        return cls.CONDITION_PARSER_MAP[tree.data](cls, list(filter(None, tree.children)))
 
-        # The leaf node terminating the recursive chain
-        if tree.data == 'predicate':
-            return cls.parse_predicate(tree.children[0])
+    @classmethod
+    def parse_or_condition(cls, children):
+        """
+        Parse a `boolean_expr` node (If the number of the children is 1, just pass it down without any operation)
+        """
 
-        # Before encountering a leaf node, repeat the below process recursively
-        else:
-            # If the number of the children is 1, just pass it down without any operation
-            # Only when `tree.data` is either `boolean_expr`, `boolean_term`, `boolean_factor`, or `boolean_test`
-            if len(children) == 1:
-                return cls.parse_condition(children[0])
-
-            if tree.data == 'boolean_expr':
-                return {
-                    'leaf': False,
-                    'operation': 'or',
-                    'operands': [cls.parse_condition(child) for child in children if isinstance(child, Tree)]
-                }
-            elif tree.data == 'boolean_term':
-                return {
-                    'leaf': False,
-                    'operation': 'and',
-                    'operands': [cls.parse_condition(child) for child in children if isinstance(child, Tree)]
-                }
-            elif tree.data == 'boolean_factor':
-                return {
-                    'leaf': False,
-                    'operation': 'not',
-                    'operands': [cls.parse_condition(children[1])]
-                }
-            elif tree.data == 'parenthesized_boolean_expr':
-                return cls.parse_condition(children[1])
+        if len(children) == 1:
+            return cls.parse_condition(children[0])
+
+        return {
+            'leaf': False,
+            'operation': 'or',
+            'operands': [cls.parse_condition(child) for child in children if isinstance(child, Tree)]
+        }
+
+    @classmethod
+    def parse_and_condition(cls, children):
+        """
+        Parse a `boolean_term` node (If the number of the children is 1, just pass it down without any operation)
+        """
+
+        if len(children) == 1:
+            return cls.parse_condition(children[0])
+
+        return {
+            'leaf': False,
+            'operation': 'and',
+            'operands': [cls.parse_condition(child) for child in children if isinstance(child, Tree)]
+        }
+
+    @classmethod
+    def parse_not_condition(cls, children):
+        """
+        Parse a `boolean_factor` node (If the number of the children is 1, just pass it down without any operation)
+        """
+
+        if len(children) == 1:
+            return cls.parse_condition(children[0])
+
+        return {
+            'leaf': False,
+            'operation': 'not',
+            'operands': [cls.parse_condition(children[1])]
+        }
+
+    @classmethod
+    def parse_test_condition(cls, children):
+        """
+        Parse a `boolean_test` node, which has only a single child
+        """
+
+        return cls.parse_condition(children[0])
+
+    @classmethod
+    def parse_parenthesized_condition(cls, children):
+        """
+        Parse a `parenthesized_boolean_expr` node, by passing down the enclosed `boolean_expr` node
+        """
+
+        return cls.parse_condition(children[1])
+
+    @classmethod
+    def parse_leaf_condition(cls, children):
+        """
+        Parse a `predicate` node, which is the leaf node terminating the recursive chain
+        """
+
+        return cls.parse_predicate(children[0])
+
+    # Mapping the condition node types to the parsing functions (Unbound, since a classmethod is not callable here)
+    CONDITION_PARSER_MAP = {
+        'boolean_expr': parse_or_condition.__func__,
+        'boolean_term': parse_and_condition.__func__,
+        'boolean_factor': parse_not_condition.__func__,
+        'boolean_test': parse_test_condition.__func__,
+        'parenthesized_boolean_expr': parse_parenthesized_condition.__func__,
+        'predicate': parse_leaf_condition.__func__
+    }
 
     @classmethod
     def validate_condition(cls, condition, meta):
@@ -188,11 +310,10 @@ class SQLExecutor(Transformer):
                 # When the operand is a column
                 else:
                     column_expr = operand['expr']
+                    table_name, column_name = operand['expr_parts']
 
                     # When the table name is specified
-                    if '.' in column_expr:
-                        table_name, column_name = column_expr.split('.')
-
+                    if table_name is not None:
                         # Error: When the referrenced table does not exist
                         if table_name not in meta['available_table_name_dict']:
                             raise exceptions.WhereTableNotSpecified
@@ -203,8 +324,6 @@ class SQLExecutor(Transformer):
 
                     # When the table name is not specified
                     else:
-                        column_name = column_expr
-
                         # Error: When the referrenced column does not exist
                         if column_name not in meta['available_column_name_dict']:
                             raise exceptions.WhereColumnNotExist
@@ -238,6 +357,102 @@ class SQLExecutor(Transformer):
             for operand in condition['operands']:
                 cls.validate_condition(operand, meta)
 
+    @classmethod
+    def get_selectivity_rank(cls, condition):
+        """
+        Estimate how selective the condition is, where the lower rank is the more selective one
+        """
+
+        if not condition['leaf']:
+            return 2  # Nested boolean expression
+        elif condition['operation'] in ('=', 'is null', 'is not null'):
+            return 0
+        else:
+            return 1
+
+    @classmethod
+    def reorder_condition(cls, condition):
+        """
+        Reorder the operands of `AND`/`OR` recursively, so that the operand likely to decide the result is evaluated first
+        `AND` evaluates the more selective operands first, while `OR` evaluates the less selective operands first
+        """
+
+        # The leaf node terminating the recursive chain
+        if condition['leaf']:
+            return condition
+
+        # Before encountering a leaf node, repeat the below process recursively
+        operand_list = [cls.reorder_condition(operand) for operand in condition['operands']]
+        if condition['operation'] == 'and':
+            operand_list.sort(key=cls.get_selectivity_rank)
+        elif condition['operation'] == 'or':
+            operand_list.sort(key=cls.get_selectivity_rank, reverse=True)
+
+        return {**condition, 'operands': operand_list}
+
+    @classmethod
+    def make_constant_condition(cls, value):
+        """
+        Make a leaf node whose result is always `value` (either `True` or `False`), without any operand
+        """
+
+        return {'leaf': True, 'operation': 'const', 'operands': [], 'value': value}
+
+    @classmethod
+    def fold_condition(cls, condition):
+        """
+        Fold the constant parts of the condition recursively (Assume the condition is validated)
+        A comparison between two values is evaluated in advance, and then eliminated from `AND`/`OR` if possible
+        """
+
+        # The leaf node terminating the recursive chain
+        if condition['leaf']:
+            # Note: The validated comparison between two values never involves `null`, so that the result is not 'Unknown'
+            operands = condition['operands']
+            if len(operands) == 2 and operands[0]['type'] == 'value' and operands[1]['type'] == 'value':
+                return cls.make_constant_condition(
+                    cls.OPERATOR_MAP[condition['operation']](operands[0]['expr'], operands[1]['expr'])
+                )
+
+            return condition
+
+        # Before encountering a leaf node, repeat the below process recursively
+        operand_list = [cls.fold_condition(operand) for operand in condition['operands']]
+
+        # NOT
+        if condition['operation'] == 'not':
+            if operand_list[0]['operation'] == 'const':
+                return cls.make_constant_condition(not operand_list[0]['value'])
+
+            return {**condition, 'operands': operand_list}
+
+        # AND/OR (A constant operand either decides the result, or does not affect the result at all)
+        decisive_value = condition['operation'] == 'or'
+        if any(operand['operation'] == 'const' and operand['value'] == decisive_value for operand in operand_list):
+            return cls.make_constant_condition(decisive_value)
+
+        operand_list = [operand for operand in operand_list if operand['operation'] != 'const']
+        if not operand_list:
+            return cls.make_constant_condition(not decisive_value)
+        if len(operand_list) == 1:
+            return operand_list[0]
+
+        return {**condition, 'operands': operand_list}
+
+    def prepare_condition(self, tree, meta):
+        """
+        Parse and validate a condition node (`boolean_expr`), and return the parsed result
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        # Parse and validate the condition
+        condition = self.parse_condition(tree)
+        self.validate_condition(condition, meta)
+
+        # Fold the constants and reorder the operands for evaluation
+        # Note: Both are performed after validation, for keeping the order of the validation errors
+        return self.reorder_condition(self.fold_condition(condition))
+
     @classmethod
     def serialize_value(cls, value):
         """
@@ -258,7 +473,7 @@ class SQLExecutor(Transformer):
         """
 
         if value is not None and column_type == 'date':
-            return datetime.strptime(value, '%Y-%m-%d').date()
+            return cls.parse_date(value)
         else:
             return value
 
@@ -276,94 +491,360 @@ class SQLExecutor(Transformer):
             return 'date'
 
     @classmethod
-    def filter_record(cls, record, condition, meta):
+    def compile_condition(cls, condition, meta):
         """
-        Check if the record satisfies the condition recursively
-        The result is either `True`, `False`, or `None` (`None` means `Unknown`)
+        Compile the condition into a Python function, which checks if a record satisfies the condition
+        The result of the function is either `True`, `False`, or `None` (`None` means `Unknown`)
         `meta` argument contains the metadata about available tables/columns
         """
 
+        constant_list = []
+        expr = cls.compile_condition_expr(condition, meta, constant_list, itertools.count())
+
+        # Define the function from the generated source, where the constants are bound as global variables
+        namespace = {f'c{idx}': constant for idx, constant in enumerate(constant_list)}
+        exec(compile(f'def filter_record(record):\n    return (False, None, True)[{expr}]', '<condition>', 'exec'), namespace)
+
+        return namespace['filter_record']
+
+    @classmethod
+    def compile_condition_expr(cls, condition, meta, constant_list, counter):
+        """
+        Compile the condition into a Python expression recursively
+        The expression evaluates to either `2`, `0`, or `1` (`True`, `False`, or `Unknown`), so that `AND` is `min()`,
+        `OR` is `max()`, and `NOT` is `2 - x` (The sub-expressions are short-circuited when their result is decided)
+        """
+
         # The leaf node terminating the recursive chain
         if condition['leaf']:
             # Operation
             operation = condition['operation']
 
-            # Operands
-            operands = []
+            # Constant (See `fold_condition()`)
+            if operation == 'const':
+                return '2' if condition['value'] else '0'
+
+            # Operands (Each operand is either a constant or a column of the record)
+            operand_exprs = []
             for operand in condition['operands']:
                 # When the operand is a value
                 if operand['type'] == 'value':
-                    operands.append(operand['expr'])
+                    operand_exprs.append(f'c{len(constant_list)}')
+                    constant_list.append(operand['expr'])
 
                 # When the operand is a column
                 else:
-                    column_expr = operand['expr']
+                    column_expr = cls.resolve_column_expr(operand, meta)
+                    operand_exprs.append(f'record[{column_expr!r}]')
 
-                    # When the table name is not specified
-                    if '.' not in column_expr:
-                        column_name = operand['expr']
-                        table_name = meta['available_column_name_dict'][column_name][0]
-                        column_expr = f'{table_name}.{column_name}'
+            # Binary operation (Comparison)
+            if len(operand_exprs) == 2:
+                # Comparison with `null` returns 'Unknown'
+                a, b = f'v{next(counter)}', f'v{next(counter)}'
+                return (
+                    f'(1 if ({a} := {operand_exprs[0]}) is None or ({b} := {operand_exprs[1]}) is None '
+                    f'else 2 if {a} {cls.OPERATION_MAP[operation]} {b} else 0)'
+                )
+
+            # Unary operation
+            else:
+                return f'(2 if {operand_exprs[0]} {cls.OPERATION_MAP[operation]} else 0)'
+
+        # Before encountering a leaf node, repeat the below process recursively
+        else:
+            sub_exprs = [
+                cls.compile_condition_expr(operand, meta, constant_list, counter)
+                for operand in condition['operands']
+            ]
+
+            # NOT
+            if condition['operation'] == 'not':
+                return f'(2 - {sub_exprs[0]})'
+
+            # AND (Decided as `False` when encountering `False`) / OR (Decided as `True` when encountering `True`)
+            decided, reduce = ('0', 'min') if condition['operation'] == 'and' else ('2', 'max')
+            names = [f'v{next(counter)}' for _ in sub_exprs]
+            return '({} else {}({}))'.format(
+                ' else '.join(f'{decided} if ({name} := {sub_expr}) == {decided}' for name, sub_expr in zip(names, sub_exprs)),
+                reduce,
+                ', '.join(names)
+            )
+
+    @classmethod
+    def get_referenced_column_exprs(cls, condition, meta):
+        """
+        Get the set of column expressions (`table_name.column_name`) referenced by the condition recursively
+        Assume the condition is validated
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        # The leaf node terminating the recursive chain
+        if condition['leaf']:
+            column_expr_set = set()
+            for operand in condition['operands']:
+                if operand['type'] == 'column':
+                    column_expr = cls.resolve_column_expr(operand, meta)
+                    column_expr_set.add(column_expr)
+
+            return column_expr_set
+
+        # Before encountering a leaf node, repeat the below process recursively
+        else:
+            return set().union(*[cls.get_referenced_column_exprs(operand, meta) for operand in condition['operands']])
+
+    @classmethod
+    def get_referenced_table_names(cls, condition, meta):
+        """
+        Get the set of table names referenced by the condition (Assume the condition is validated)
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        return {column_expr.split('.')[0] for column_expr in cls.get_referenced_column_exprs(condition, meta)}
+
+    @classmethod
+    def get_equijoin_column_exprs(cls, condition, meta):
+        """
+        Get the pair of column expressions compared by the condition, if it is an equijoin between two different tables
+        Otherwise, return `None` (Assume the condition is validated)
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        if not condition['leaf'] or condition['operation'] != '=':
+            return None
+        if any(operand['type'] != 'column' for operand in condition['operands']):
+            return None
+
+        column_expr_list = [cls.resolve_column_expr(operand, meta) for operand in condition['operands']]
 
-                    operands.append(record[column_expr])
+        if column_expr_list[0].split('.')[0] == column_expr_list[1].split('.')[0]:
+            return None
+
+        return tuple(column_expr_list)
+
+    @classmethod
+    def build_column_array(cls, value_list, column_type):
+        """
+        Build a NumPy array from the values of a column, along with the mask of `null` values
+        The `null` values are filled with a dummy value of the column type, which must be masked out when evaluated
+        """
+
+        null_mask = np.array([value is None for value in value_list], dtype=bool)
+
+        if column_type == 'int':
+            dtype, dummy = np.int64, 0
+        elif column_type == 'date':
+            dtype, dummy = 'datetime64[D]', date.min
+        else:
+            dtype, dummy = object, ''
+
+        filled_value_list = [dummy if value is None else value for value in value_list]
+        try:
+            return np.array(filled_value_list, dtype=dtype), null_mask
+
+        # When some `int` value exceeds 64 bits
+        except OverflowError:
+            return np.array(filled_value_list, dtype=object), null_mask
+
+    @classmethod
+    def vectorize_condition(cls, condition, meta, column_array_dict, size):
+        """
+        Evaluate the condition over all records at once recursively, using NumPy arrays
+        The result is an array of `2`, `0`, or `1` (`True`, `False`, or `Unknown`) for each record,
+        which is combined in the same way as `compile_condition_expr()`
+        `column_array_dict` maps each referenced column expression to its array and `null` mask (`build_column_array()`)
+        """
+
+        # The leaf node terminating the recursive chain
+        if condition['leaf']:
+            # Operation
+            operation = condition['operation']
+
+            # Constant (See `fold_condition()`)
+            if operation == 'const':
+                return np.full(size, 2 if condition['value'] else 0, dtype=np.int8)
+
+            # Operands (Each operand is a pair of the value(s) and the `null` mask)
+            operands = []
+            for operand in condition['operands']:
+                # When the operand is a value
+                if operand['type'] == 'value':
+                    operands.append((operand['expr'], None))
+
+                # When the operand is a column
+                else:
+                    column_expr = cls.resolve_column_expr(operand, meta)
+                    operands.append(column_array_dict[column_expr])
 
             # Binary operation (Comparison)
             if len(operands) == 2:
-                # Error: Comparison with `null` returns 'Unknown'
-                if operands[0] is None or operands[1] is None:
-                    return None
+                # Compare as Python objects, when some `int` value exceeds 64 bits (NumPy would compare it as float64)
+                if any(isinstance(value, int) and not cls.INT64_MIN <= value <= cls.INT64_MAX for value, _ in operands):
+                    operands = [(np.asarray(value, dtype=object), null_mask) for value, null_mask in operands]
+
+                (value1, null_mask1), (value2, null_mask2) = operands
+                result = np.where(cls.OPERATOR_MAP[operation](value1, value2), 2, 0)
 
-                return eval(f'operands[0] {cls.OPERATION_MAP[operation]} operands[1]')
+                # Comparison with `null` returns 'Unknown'
+                for null_mask in (null_mask1, null_mask2):
+                    if null_mask is not None:
+                        result = np.where(null_mask, 1, result)
 
-            # Unary opeartion
+            # Unary operation
             else:
-                return eval(f'operands[0] {cls.OPERATION_MAP[operation]}')
+                null_mask = operands[0][1]
+                result = np.where(null_mask, 2, 0) if operation == 'is null' else np.where(null_mask, 0, 2)
+
+            return np.broadcast_to(result.astype(np.int8), (size,))
 
         # Before encountering a leaf node, repeat the below process recursively
         else:
+            result_list = [
+                cls.vectorize_condition(operand, meta, column_array_dict, size)
+                for operand in condition['operands']
+            ]
+
             # OR
             if condition['operation'] == 'or':
-                sub_result_set = {cls.filter_record(record, operand, meta) for operand in condition['operands']}
-                return True if True in sub_result_set else None if None in sub_result_set else False
+                return np.maximum.reduce(result_list)
 
             # AND
             if condition['operation'] == 'and':
-                sub_result_set = {cls.filter_record(record, operand, meta) for operand in condition['operands']}
-                return False if False in sub_result_set else None if None in sub_result_set else True
+                return np.minimum.reduce(result_list)
 
             # NOT
             if condition['operation'] == 'not':
-                sub_result = cls.filter_record(record, condition['operands'][0], meta)
-                return None if sub_result is None else not sub_result
+                return 2 - result_list[0]
+
+    @classmethod
+    def evaluate_condition(cls, column_dict, size, condition, meta):
+        """
+        Evaluate the condition for each of `size` records of a single table at once (See `vectorize_condition()`)
+        `column_dict` maps each column expression to the list of its values (At least the referenced columns are needed)
+        Only the columns referenced by the condition are converted into NumPy arrays
+        """
+
+        column_array_dict = {
+            column_expr: cls.build_column_array(column_dict[column_expr], meta['column_type_dict'][column_expr])
+            for column_expr in cls.get_referenced_column_exprs(condition, meta)
+        }
+
+        return cls.vectorize_condition(condition, meta, column_array_dict, size)
+
+    @classmethod
+    def resolve_selection(cls, selection, meta):
+        """
+        Resolve the selected columns, where `selection` is a tuple of the pairs of the column expression parts and alias
+        Return the column expressions (`table_name.column_name`) along with the headers to display
+        `meta` argument contains the metadata about available tables/columns
+        """
+
+        selected_column_expr_list = []
+        column_alias_dict = {}
+        for (table_name, column_name), column_alias in selection:
+            # When the table name is specified
+            if table_name is not None:
+                column_expr = f'{table_name}.{column_name}'
+
+                # Error: When the referrenced table does not exist
+                if table_name not in meta['available_table_name_dict']:
+                    raise exceptions.SelectColumnResolveError(column_expr)
+
+                # Error: When the referrenced column does not exist
+                if column_name not in meta['available_table_name_dict'][table_name]:
+                    raise exceptions.SelectColumnResolveError(column_expr)
+
+                selected_column_expr_list.append(column_expr)
+
+            # When the table name is not specified
+            else:
+                # Error: When the referrenced column does not exist
+                if column_name not in meta['available_column_name_dict']:
+                    raise exceptions.SelectColumnResolveError(column_name)
+
+                # Error: When the referrenced column is ambiguous
+                table_name_list = meta['available_column_name_dict'][column_name]
+                if len(table_name_list) > 1:
+                    raise exceptions.SelectColumnResolveError(column_name)
+
+                selected_column_expr_list.append(f'{table_name_list[0]}.{column_name}')
+
+            if column_alias:
+                column_alias_dict[selected_column_expr_list[-1]] = column_alias
+
+        # The headers to display (Either the column aliases or the column expressions)
+        header_list = [column_alias_dict.get(column_expr, column_expr) for column_expr in selected_column_expr_list]
+
+        return tuple(selected_column_expr_list), tuple(header_list)
+
+    @classmethod
+    def scan_table_elements(cls, tree):
+        """
+        Classify the children of a `table_element_list` node in a single pass (preserving their order)
+        Return the lists of `column_definition`, `primary_key_definition`, and `foreign_key_definition` nodes
+        """
+
+        element_dict = {'column_definition': [], 'primary_key_definition': [], 'foreign_key_definition': []}
+        for table_element in tree.children:
+            element = table_element.children[0]
+
+            # Unwrap the integrity constraint definition into either primary key or foreign key definition
+            if element.data == 'integrity_constraint_definition':
+                element = element.children[0]
+
+            element_dict[element.data].append(element)
+
+        return (
+            element_dict['column_definition'],
+            element_dict['primary_key_definition'],
+            element_dict['foreign_key_definition']
+        )
+
+    @classmethod
+    def get_column_names(cls, tree):
+        """
+        Extract the (lowercased) column names from a `column_name_list` node
+        """
+
+        return [column_name.children[0].value.lower() for column_name in tree.children]
+
+    def create_table_query(self, tree):
+        items = tree.children
 
-    def create_table_query(self, items):
         # Extract the table name
-        table_name = items[2].children[0].lower()
+        table_name = items[2].children[0].value.lower()
 
         # Error: When a table with the same name already exists
-        existing_table_name_set = set(self.db_manager.get_table_names())
-        if table_name in existing_table_name_set:
+        if self.db_manager.has_table(table_name, txn=self.txn):
             raise exceptions.TableExistenceError
 
+        # Classify the table elements (Only a single traversal over the table element list)
+        column_definition_list, primary_key_tree_list, foreign_key_tree_list = self.scan_table_elements(items[4])
+
         # Extract the column definitions
         column_list = []
         column_name_to_idx = {}
-        for idx, column_definition in enumerate(items[4].find_data('column_definition')):
-            column_name = column_definition.children[0].children[0].lower()
-            column_type = ''.join(column_definition.children[1].children).lower()
+        for idx, column_definition in enumerate(column_definition_list):
+            column_name = column_definition.children[0].children[0].value.lower()
+            column_type = ''.join([token.value for token in column_definition.children[1].children]).lower()
             column_null = column_definition.children[2] is None
 
             # Error: When there are duplicates in the column names
             if column_name in column_name_to_idx:
                 raise exceptions.DuplicateColumnDefError
 
+            # Pre-parse the type kind and the length of `char` type, which are frequently used when executing queries
+            column_type_kind = column_type[:4]
+            column_char_len = int(column_definition.children[1].children[2].value) if column_type_kind == 'char' else None
+
             # Error: When the length of `char` type is invalid
-            if column_type.startswith('char') and int(column_definition.children[1].children[2]) < 1:
+            if column_type_kind == 'char' and column_char_len < 1:
                 raise exceptions.CharLengthError
 
             column_list.append({
                 'name': column_name,
                 'type': column_type,
+                'type_kind': column_type_kind,
+                'char_len': column_char_len,
                 'null': column_null,
                 'primary': False,
                 'foreign': None
@@ -373,11 +854,8 @@ class SQLExecutor(Transformer):
 
         # Extract the primary key definitions
         primary_key_definition_list = [{
-            'column_name_list': [
-                column_name.children[0].lower()
-                for column_name in primary_key_definition.find_data('column_name')
-            ]
-        } for primary_key_definition in items[4].find_data('primary_key_definition')]
+            'column_name_list': self.get_column_names(primary_key_definition.children[3])
+        } for primary_key_definition in primary_key_tree_list]
         if primary_key_definition_list:
             # Error: When there are multiple primary key definitions
             if len(primary_key_definition_list) > 1:
@@ -387,12 +865,12 @@ class SQLExecutor(Transformer):
             column_name_list = primary_key_definition['column_name_list']
 
             # Error: When some column does not exist
-            non_existing_column_name = next(filter(
-                lambda column_name: column_name not in column_name_to_idx,
-                column_name_list
-            ), None)
-            if non_existing_column_name:
-                raise exceptions.NonExistingColumnDefError(non_existing_column_name)
+            non_existing_column_name_set = set(column_name_list).difference(column_name_to_idx)
+            if non_existing_column_name_set:
+                # Report the first one in the definition (The set is unordered)
+                raise exceptions.NonExistingColumnDefError(next(
+                    column_name for column_name in column_name_list if column_name in non_existing_column_name_set
+                ))
 
             # Error: When there are duplicates in the column names (within the primary key definition)
             if len(set(column_name_list)) < len(column_name_list):
@@ -403,36 +881,30 @@ class SQLExecutor(Transformer):
 
         # Extract the foreign key definitions
         foreign_key_definition_list = [{
-            'column_name_list': [
-                column_name.children[0].lower()
-                for column_name in foreign_key_definition.children[3].find_data('column_name')
-            ],
-            'ref_table_name': foreign_key_definition.children[6].children[0].lower(),
-            'ref_column_name_list': [
-                column_name.children[0].lower()
-                for column_name in foreign_key_definition.children[8].find_data('column_name')
-            ],
-        } for foreign_key_definition in items[4].find_data('foreign_key_definition')]
+            'column_name_list': self.get_column_names(foreign_key_definition.children[3]),
+            'ref_table_name': foreign_key_definition.children[6].children[0].value.lower(),
+            'ref_column_name_list': self.get_column_names(foreign_key_definition.children[8]),
+        } for foreign_key_definition in foreign_key_tree_list]
         for foreign_key_definition in foreign_key_definition_list:
             column_name_list = foreign_key_definition['column_name_list']
             ref_table_name = foreign_key_definition['ref_table_name']
             ref_column_name_list = foreign_key_definition['ref_column_name_list']
 
             # Error: When some column does not exist
-            non_existing_column_name = next(filter(
-                lambda column_name: column_name not in column_name_to_idx,
-                column_name_list
-            ), None)
-            if non_existing_column_name:
-                raise exceptions.NonExistingColumnDefError(non_existing_column_name)
+            non_existing_column_name_set = set(column_name_list).difference(column_name_to_idx)
+            if non_existing_column_name_set:
+                # Report the first one in the definition (The set is unordered)
+                raise exceptions.NonExistingColumnDefError(next(
+                    column_name for column_name in column_name_list if column_name in non_existing_column_name_set
+                ))
 
             # Error: When the referred table does not exist (including self-referencing)
-            if ref_table_name not in existing_table_name_set:
+            if not self.db_manager.has_table(ref_table_name, txn=self.txn):
                 raise exceptions.ReferenceTableExistenceError
 
             referred_table_column_dict = {
                 column['name']: column
-                for column in self.db_manager.get_table(ref_table_name)['columns']
+                for column in self.db_manager.get_table(ref_table_name, txn=self.txn)['columns']
             }
             referred_table_primary_key_set = {
                 column['name']
@@ -441,10 +913,7 @@ class SQLExecutor(Transformer):
             }
 
             # Error: When some referred column does not exist
-            if any(map(
-                lambda ref_column_name: ref_column_name not in referred_table_column_dict,
-                ref_column_name_list
-            )):
+            if set(ref_column_name_list).difference(referred_table_column_dict):
                 raise exceptions.ReferenceColumnExistenceError
 
             # Error: When there are duplicates in the column names (within the foreign key definition)
@@ -482,43 +951,41 @@ class SQLExecutor(Transformer):
                 raise exceptions.ReferenceNonPrimaryKeyError
 
         # Create the table in the database
-        self.db_manager.set_table(table_name, {'columns': column_list, 'records': []})
+        self.db_manager.set_table(table_name, {'columns': column_list, 'records': []}, txn=self.txn)
+
+        self.out.write(f'{PROMPT_TEXT}> \'{table_name}\' table is created\n')
 
-        print(f'{PROMPT_TEXT}> \'{table_name}\' table is created')
+    def drop_table_query(self, tree):
+        items = tree.children
 
-    def drop_table_query(self, items):
         # Extract the table name
-        table_name = items[2].children[0].lower()
+        table_name = items[2].children[0].value.lower()
 
         # Error: When the table does not exist
-        existing_table_name_set = set(self.db_manager.get_table_names())
-        if table_name not in existing_table_name_set:
+        if not self.db_manager.has_table(table_name, txn=self.txn):
             raise exceptions.NoSuchTable
 
         # Error: When a foreign key in another table refers to the table
-        for other_table_name in existing_table_name_set - {table_name}:
-            if any(map(
-                lambda column: column['foreign'] and column['foreign']['table_name'] == table_name,
-                self.db_manager.get_table(other_table_name)['columns']
-            )):
-                raise exceptions.DropReferencedTableError(table_name)
+        if self.db_manager.get_referring_table_names(table_name, txn=self.txn) - {table_name}:
+            raise exceptions.DropReferencedTableError(table_name)
 
         # Drop the table from the database
-        self.db_manager.delete_table(table_name)
+        self.db_manager.delete_table(table_name, txn=self.txn)
 
-        print(f'{PROMPT_TEXT}> \'{table_name}\' table is dropped')
+        self.out.write(f'{PROMPT_TEXT}> \'{table_name}\' table is dropped\n')
+
+    def explain_query(self, tree):
+        items = tree.children
 
-    def explain_query(self, items):
         # Extract the table name
-        table_name = items[1].children[0].lower()
+        table_name = items[1].children[0].value.lower()
 
         # Error: When the table does not exist
-        existing_table_name_set = set(self.db_manager.get_table_names())
-        if table_name not in existing_table_name_set:
+        if not self.db_manager.has_table(table_name, txn=self.txn):
             raise exceptions.NoSuchTable
 
         # Load the columns
-        column_list = self.db_manager.get_table(table_name)['columns']
+        column_list = self.db_manager.get_table(table_name, txn=self.txn)['columns']
 
         def get_display(column, key):
             """
@@ -539,54 +1006,60 @@ class SQLExecutor(Transformer):
         col_list = ['column_name', 'type', 'null', 'key']
         key_list = ['name', 'type', 'null', 'key']
 
+        # Get the display strings of each column only once
+        display_list = [tuple(get_display(column, key) for key in key_list) for column in column_list]
+
         # Set the width of each column (based on the longest value for each column)
         width_list = [len(col) + self.WIDTH_PADDING for col in col_list]
-        for column in column_list:
-            for idx, key in enumerate(key_list):
-                width_list[idx] = max(width_list[idx], len(get_display(column, key)) + self.WIDTH_PADDING)
+        for display in display_list:
+            for idx, value in enumerate(display):
+                width_list[idx] = max(width_list[idx], len(value) + self.WIDTH_PADDING)
 
-        # Print the result
+        # Print the result (Written at once, instead of printing line by line)
         dividing_line = '-' * sum(width_list)
-        print(dividing_line)
-        print(f'table_name [{table_name}]')
-        print(''.join([f'{column:<{width_list[idx]}}' for idx, column in enumerate(col_list)]))
-        print('\n'.join([
-            ''.join([f'{get_display(column, key):<{width_list[idx]}}' for idx, key in enumerate(key_list)])
-            for column in column_list
-        ]))
-        print(dividing_line)
-
-    def describe_query(self, items):
+        self.out.writelines([
+            f'{dividing_line}\n',
+            f'table_name [{table_name}]\n',
+            ''.join(col.ljust(width) for col, width in zip(col_list, width_list)) + '\n',
+            '\n'.join([
+                ''.join(value.ljust(width) for value, width in zip(display, width_list))
+                for display in display_list
+            ]) + '\n',
+            f'{dividing_line}\n'
+        ])
+
+    def describe_query(self, tree):
         # The same as `EXPLAIN` query
-        self.explain_query(items)
+        self.explain_query(tree)
 
-    def desc_query(self, items):
+    def desc_query(self, tree):
         # The same as `EXPLAIN` query
-        self.explain_query(items)
+        self.explain_query(tree)
+
+    def insert_query(self, tree):
+        items = tree.children
 
-    def insert_query(self, items):
         # Extract the table name
-        table_name = items[2].children[0].lower()
+        table_name = items[2].children[0].value.lower()
 
         # Error: When the table does not exist
-        existing_table_name_set = set(self.db_manager.get_table_names())
-        if table_name not in existing_table_name_set:
+        if not self.db_manager.has_table(table_name, txn=self.txn):
             raise exceptions.NoSuchTable
 
         # Load the table and its columns
-        table = self.db_manager.get_table(table_name)
+        table = self.db_manager.get_table(table_name, txn=self.txn)
         column_list = table['columns']
 
         # The column names that specified what value to insert
         if not items[3]:
             column_name_list = [column['name'] for column in column_list]  # Imply all columns
         else:
-            column_name_list = [column_name.children[0].lower() for column_name in items[4].find_data('column_name')]
+            column_name_list = [column_name.children[0].value.lower() for column_name in items[4].find_data('column_name')]
 
             # Error: When some column does not exist
-            existing_column_name_set = {column['name'] for column in column_list}
+            column_by_name = {column['name']: column for column in column_list}
             for column_name in column_name_list:
-                if column_name not in existing_column_name_set:
+                if column_name not in column_by_name:
                     raise exceptions.InsertColumnExistenceError(column_name)
 
             # Error: When there are duplicates in the column names
@@ -594,23 +1067,22 @@ class SQLExecutor(Transformer):
                 raise exceptions.EtcError
 
         # The column values that is specified
-        column_value_list = [column_value.children[0] for column_value in items[8].find_data('column_value')]
+        column_value_list = [column_value.children[0].value for column_value in items[8].find_data('column_value')]
 
         # Error: When the number of the column names is different from the number of the column values
         if len(column_name_list) != len(column_value_list):
             raise exceptions.InsertTypeMismatchError
 
+        # Map each column name to the column value that is specified
+        column_value_dict = dict(zip(column_name_list, column_value_list))
+
         # Construct the record to insert
         record = {}
         for column in column_list:
             column_name = column['name']
-            column_type = column['type']
+            column_type_kind = column['type_kind']
             column_null = column['null']
-
-            if column_name not in column_name_list:
-                column_value = 'null'
-            else:
-                column_value = column_value_list[column_name_list.index(column_name)]
+            column_value = column_value_dict.get(column_name, 'null')
 
             # Parse the column value
             parsed_type, parsed_value = self.parse_value(column_value)
@@ -620,63 +1092,61 @@ class SQLExecutor(Transformer):
                 raise exceptions.InsertColumnNonNullableError(column_name)
 
             # Error: When the type of the column value is invalid
-            if parsed_type != 'null' and parsed_type != column_type[:4]:
+            if parsed_type != 'null' and parsed_type != column_type_kind:
                 raise exceptions.InsertTypeMismatchError
 
             # Truncate the `char(n)` value
             if parsed_type == 'char':
-                n = int(column_type[5:-1])
-                parsed_value = parsed_value[:n]
+                parsed_value = parsed_value[:column['char_len']]
 
             record[column_name] = self.serialize_value(parsed_value)
 
-        # Insert the record into the table
-        table['records'].append(record)
-        self.db_manager.set_table(table_name, table)
+        # Insert the record into the table (Only the record is written to the database)
+        self.db_manager.append_record(table_name, record, txn=self.txn)
+
+        self.out.write(f'{PROMPT_TEXT}> 1 row inserted\n')
 
-        print(f'{PROMPT_TEXT}> 1 row inserted')
+    def delete_query(self, tree):
+        items = tree.children
 
-    def delete_query(self, items):
         # Extract the table name
-        table_name = items[2].children[0].lower()
+        table_name = items[2].children[0].value.lower()
 
         # Error: When the table does not exist
-        existing_table_name_set = set(self.db_manager.get_table_names())
-        if table_name not in existing_table_name_set:
+        if not self.db_manager.has_table(table_name, txn=self.txn):
             raise exceptions.NoSuchTable
 
         # Load the table and its columns/records
-        table = self.db_manager.get_table(table_name)
+        table = self.db_manager.get_table(table_name, txn=self.txn)
         column_list = table['columns']
         record_list = table['records']
 
         # When 'WHERE' clause is specified
         if items[4]:
-            # Preprocess the records (for identifying each column and deserializing the values into comparable values)
-            preprocessed_record_list = list(map(lambda record: {
-                f'{table_name}.{column["name"]}': self.deserialize_value(record[column['name']], column['type'])
-                for column in column_list
-            }, record_list))
-
             # Metadata about available tables/columns
             meta = {
                 'available_table_name_dict': {table_name: [column['name'] for column in column_list]},
                 'available_column_name_dict': {column['name']: [table_name] for column in column_list},
-                'column_type_dict': {f'{table_name}.{column["name"]}': column['type'][:4] for column in column_list}
+                'column_type_dict': {f'{table_name}.{column["name"]}': column['type_kind'] for column in column_list}
             }
 
-            # Parse the condition specified in `WHERE` clause
-            condition = self.parse_condition(items[4])
+            # Parse and validate the condition specified in `WHERE` clause
+            condition = self.prepare_condition(items[4], meta)
 
-            # Validate the condition
-            self.validate_condition(condition, meta)
+            # Preprocess the columns referenced by the condition, in columnar layout
+            # (for identifying each column and deserializing the values into comparable values)
+            referenced_column_expr_set = self.get_referenced_column_exprs(condition, meta)
+            column_dict = {
+                f'{table_name}.{column["name"]}': [
+                    self.deserialize_value(record[column['name']], column['type_kind']) for record in record_list
+                ]
+                for column in column_list
+                if f'{table_name}.{column["name"]}' in referenced_column_expr_set
+            }
 
             # Filter the records, based on the condition
-            new_record_list = [
-                record_list[idx]
-                for idx, record in enumerate(preprocessed_record_list)
-                if not self.filter_record(record, condition, meta)
-            ]
+            result_list = self.evaluate_condition(column_dict, len(record_list), condition, meta)
+            new_record_list = list(itertools.compress(record_list, (result_list != 2).tolist()))
 
         # Otherwise, delete all records
         else:
@@ -684,13 +1154,12 @@ class SQLExecutor(Transformer):
 
         # Delete the records from the table
         table['records'] = new_record_list
-        self.db_manager.set_table(table_name, table)
+        self.db_manager.set_table(table_name, table, txn=self.txn)
 
-        print(f'{PROMPT_TEXT}> {len(record_list) - len(new_record_list)} row(s) deleted')
+        self.out.write(f'{PROMPT_TEXT}> {len(record_list) - len(new_record_list)} row(s) deleted\n')
 
-    def select_query(self, items):
-        # Load the table names
-        existing_table_name_set = set(self.db_manager.get_table_names())
+    def select_query(self, tree):
+        items = tree.children
 
         # The set of table names, for detecting conflict in the table names
         table_name_set = set()
@@ -698,20 +1167,21 @@ class SQLExecutor(Transformer):
         # Map column expression to column type
         column_type_dict = dict()
 
-        # Prepare the records for each table
-        list_of_record_list = []
+        # Prepare the records for each table (in columnar layout), along with the number of the records
+        list_of_column_dict = []
+        record_count_list = []
         column_expr_list = []
         for table_name_as in items[3].find_data('table_expr'):
             # Extract the table name/alias
-            table_name = table_name_as.children[0].children[0].lower()
-            table_alias = table_name_as.children[2].children[0].lower() if table_name_as.children[2] else None
+            table_name = table_name_as.children[0].children[0].value.lower()
+            table_alias = table_name_as.children[2].children[0].value.lower() if table_name_as.children[2] else None
 
             # Error: When the table does not exist
-            if table_name not in existing_table_name_set:
+            if not self.db_manager.has_table(table_name, txn=self.txn):
                 raise exceptions.SelectTableExistenceError(table_name)
 
             # Load the table and its columns/records
-            table = self.db_manager.get_table(table_name)
+            table = self.db_manager.get_table(table_name, txn=self.txn)
             column_list = table['columns']
             record_list = table['records']
 
@@ -725,25 +1195,20 @@ class SQLExecutor(Transformer):
 
             table_name_set.add(table_name)
 
-            # Preprocess the records (for identifying each column and deserializing the values into comparable values)
-            preprocessed_record_list = list(map(lambda record: {
-                f'{table_name}.{column["name"]}': self.deserialize_value(record[column['name']], column['type'])
+            # Preprocess the records in columnar layout
+            # (for identifying each column and deserializing the values into comparable values)
+            list_of_column_dict.append({
+                f'{table_name}.{column["name"]}': [
+                    self.deserialize_value(record[column['name']], column['type_kind']) for record in record_list
+                ]
                 for column in column_list
-            }, record_list))
-            list_of_record_list.append(preprocessed_record_list)
+            })
+            record_count_list.append(len(record_list))
 
             for column in column_list:
                 column_expr = f'{table_name}.{column["name"]}'
                 column_expr_list.append(column_expr)
-                column_type_dict[column_expr] = column['type'][:4]
-
-        # Merge all records into a table (Cartesian Product)
-        merged_record_list = []
-        for comb in itertools.product(*list_of_record_list):
-            merged_record = {}
-            for record in comb:
-                merged_record.update(record)
-            merged_record_list.append(merged_record)
+                column_type_dict[column_expr] = column['type_kind']
 
         # Metadata about available tables/columns
         meta = {
@@ -762,120 +1227,175 @@ class SQLExecutor(Transformer):
                 meta['available_column_name_dict'][column_name] = []
             meta['available_column_name_dict'][column_name].append(table_name)
 
+        # The table names (or aliases), in the order of `FROM` clause
+        table_name_list = list(meta['available_table_name_dict'])
+
+        # The compiled conditions to check for each merged record
+        filter_record_list = []
+
+        # The pairs of column expressions to join the tables on (Equijoin)
+        equijoin_list = []
+
         # When 'WHERE' clause is specified
         if items[5]:
-            # Parse the condition specified in `WHERE` clause
-            condition = self.parse_condition(items[5])
+            # Parse and validate the condition specified in `WHERE` clause
+            condition = self.prepare_condition(items[5], meta)
+
+            # Filter the records of each table in advance, based on the conjuncts referencing only the table
+            for sub_condition in (condition['operands'] if condition['operation'] == 'and' else [condition]):
+                referenced_table_name_set = self.get_referenced_table_names(sub_condition, meta)
+                if len(referenced_table_name_set) == 1:
+                    idx = table_name_list.index(referenced_table_name_set.pop())
+                    result_list = self.evaluate_condition(
+                        list_of_column_dict[idx], record_count_list[idx], sub_condition, meta
+                    )
+                    selector_list = (result_list == 2).tolist()
+                    list_of_column_dict[idx] = {
+                        column_expr: list(itertools.compress(value_list, selector_list))
+                        for column_expr, value_list in list_of_column_dict[idx].items()
+                    }
+                    record_count_list[idx] = sum(selector_list)
 
-            # Validate the condition
-            self.validate_condition(condition, meta)
+                # Join the tables on the conjuncts comparing the columns from two tables for equality, using hash tables
+                elif self.get_equijoin_column_exprs(sub_condition, meta):
+                    equijoin_list.append(self.get_equijoin_column_exprs(sub_condition, meta))
 
-            # Filter the records, based on the condition
-            merged_record_list = [
-                record
-                for record in merged_record_list
-                if self.filter_record(record, condition, meta)
-            ]
+                else:
+                    filter_record_list.append(self.compile_condition(sub_condition, meta))
+
+        # Restore the remaining records of each table from columnar layout
+        list_of_record_list = [
+            [dict(zip(column_dict, value_list)) for value_list in zip(*column_dict.values())]
+            for column_dict in list_of_column_dict
+        ]
+
+        def join_records(merged_record_iter, record_list, join_key_list):
+            """
+            Join the merged records with the records of the next table, in the same order as Cartesian Product
+            The records to join are looked up by a hash table on `join_key_list`, a list of the pairs of
+            the column expressions from the merged record and the next table (Cartesian Product if empty)
+            """
+
+            # Cartesian Product
+            if not join_key_list:
+                for merged_record in merged_record_iter:
+                    for record in record_list:
+                        yield {**merged_record, **record}
+                return
+
+            # Build a hash table on the records of the next table (Comparison with `null` never matches)
+            record_list_dict = {}
+            for record in record_list:
+                key = tuple(record[column_expr] for _, column_expr in join_key_list)
+                if None not in key:
+                    record_list_dict.setdefault(key, []).append(record)
+
+            # Probe the hash table with each merged record
+            for merged_record in merged_record_iter:
+                key = tuple(merged_record[column_expr] for column_expr, _ in join_key_list)
+                for record in record_list_dict.get(key, ()):
+                    yield {**merged_record, **record}
+
+        # Merge all records into a table, joining the tables one by one
+        # Note: The records are merged lazily, so that only the records satisfying the conditions are kept
+        merged_record_iter = iter([{}])
+        joined_table_name_set = set()
+        for table_name, record_list in zip(table_name_list, list_of_record_list):
+            join_key_list = []
+            for equijoin in equijoin_list:
+                for column_expr1, column_expr2 in (equijoin, equijoin[::-1]):
+                    if column_expr1.split('.')[0] in joined_table_name_set and column_expr2.split('.')[0] == table_name:
+                        join_key_list.append((column_expr1, column_expr2))
+
+            merged_record_iter = join_records(merged_record_iter, record_list, join_key_list)
+            joined_table_name_set.add(table_name)
 
         # Select the columns to display
         column_expr_as_list = list(items[1].find_data('column_expr'))
-        column_alias_dict = {}
         if not column_expr_as_list:
-            selected_column_expr_list = column_expr_list  # Select all columns (*)
+            selected_column_expr_list = header_list = column_expr_list  # Select all columns (*)
         else:
-            selected_column_expr_list = []
-            for column_expr_as in column_expr_as_list:
-                # Extract the column expr/alias
-                column_expr = '.'.join([child.children[0].lower() for child in filter(None, column_expr_as.children[:2])])
-                column_alias = column_expr_as.children[3].children[0].lower() if column_expr_as.children[3] else None
-
-                # When the table name is specified
-                if '.' in column_expr:
-                    table_name, column_name = column_expr.split('.')
+            # Extract the column expr/alias
+            selection = tuple(
+                (
+                    self.parse_column_operand(column_expr_as.children[:2])['expr_parts'],
+                    column_expr_as.children[3].children[0].value.lower() if column_expr_as.children[3] else None
+                )
+                for column_expr_as in column_expr_as_list
+            )
+
+            # Resolve the selected columns along with their headers
+            selected_column_expr_list, header_list = self.resolve_selection(selection, meta)
+
+        # Project the selected columns of each record into a tuple, for accessing the values by position
+        if len(selected_column_expr_list) == 1:
+            selected_column_expr = selected_column_expr_list[0]
+
+            # Note: `itemgetter()` with a single column returns the value itself, instead of a tuple
+            def get_row(record):
+                return (record[selected_column_expr],)
 
-                    # Error: When the referrenced table does not exist
-                    if table_name not in meta['available_table_name_dict']:
-                        raise exceptions.SelectColumnResolveError(column_expr)
-
-                    # Error: When the referrenced column does not exist
-                    if column_name not in meta['available_table_name_dict'][table_name]:
-                        raise exceptions.SelectColumnResolveError(column_expr)
-
-                    selected_column_expr_list.append(column_expr)
-
-                # When the table name is not specified
-                else:
-                    column_name = column_expr
+        else:
+            get_row = operator.itemgetter(*selected_column_expr_list)
 
-                    # Error: When the referrenced column does not exist
-                    if column_name not in meta['available_column_name_dict']:
-                        raise exceptions.SelectColumnResolveError(column_name)
+        # Filter the merged records based on the remaining conditions, keeping only the selected columns
+        merged_row_list = [
+            get_row(merged_record)
+            for merged_record in merged_record_iter
+            if all(filter_record(merged_record) for filter_record in filter_record_list)
+        ]
 
-                    # Error: When the referrenced column is ambiguous
-                    table_name_list = meta['available_column_name_dict'][column_name]
-                    if len(table_name_list) > 1:
-                        raise exceptions.SelectColumnResolveError(column_name)
+        # Fast path for the empty result, where only the headers are displayed
+        if not merged_row_list:
+            dividing_line = '+' + '+'.join('-' * (len(header) + self.WIDTH_PADDING) for header in header_list) + '+\n'
+            self.out.write(
+                dividing_line + '|' + '|'.join(
+                    (' ' + header).ljust(len(header) + self.WIDTH_PADDING) for header in header_list
+                ) + '|\n' + dividing_line
+            )
+            return
+
+        # Choose the function getting the display strings for each column, based on the column type
+        # Note: Only the display strings of `date` values are memoized within the query, since `strftime()` is costly
+        #       and the same dates are usually repeated over the records (Memoizing `int` values costs more than `str()`)
+        formatter_list = [
+            functools.lru_cache(maxsize=None)(self.DISPLAY_FORMATTER_MAP['date'])
+            if column_type_dict[column_expr] == 'date' else self.DISPLAY_FORMATTER_MAP[column_type_dict[column_expr]]
+            for column_expr in selected_column_expr_list
+        ]
 
-                    selected_column_expr_list.append(f'{table_name_list[0]}.{column_name}')
+        # Get the display strings of the selected columns for each record, only once per value
+        display_list = [[formatter(value) for formatter, value in zip(formatter_list, row)] for row in merged_row_list]
 
-                if column_alias:
-                    column_alias_dict[selected_column_expr_list[-1]] = column_alias
+        # Set the width of each column (based on the longest value for each column, including the header)
+        width_list = [
+            max(map(len, display_column)) + self.WIDTH_PADDING
+            for display_column in zip(header_list, *display_list)
+        ]
 
-        def get_display(value):
-            """
-            Get the display string from a Python value
-            """
+        # Print the result (Written at once, instead of printing line by line)
+        # Note: The lines already end with the newline character, so that they are simply concatenated
+        dividing_line = '+' + '+'.join('-' * width for width in width_list) + '+\n'
 
-            if value is None:
-                return 'null'
-            elif isinstance(value, int):
-                return str(value)
-            elif isinstance(value, str):
-                return value
-            else:
-                return value.strftime('%Y-%m-%d')
+        # Format each row by a single call of the row template, which is built only once for the query
+        # Note: The leading space of each cell is baked into the template, so that the cells are passed as they are
+        format_row = ('|' + '|'.join([f' {{:<{width - 1}}}' for width in width_list]) + '|\n').format
+        self.out.write(
+            dividing_line + format_row(*header_list) + dividing_line +
+            ''.join(itertools.starmap(format_row, display_list)) + dividing_line
+        )
 
-        # Set the width of each column (based on the longest value for each column)
-        width_list = [
-            len(column_alias_dict.get(column_expr, column_expr)) + self.WIDTH_PADDING
-            for column_expr in selected_column_expr_list
-        ]
-        for record in merged_record_list:
-            for idx, column_expr in enumerate(selected_column_expr_list):
-                width_list[idx] = max(width_list[idx], len(get_display(record[column_expr])) + self.WIDTH_PADDING)
-
-        # Print the result
-        dividing_line = '+' + '+'.join(['-' * width for width in width_list]) + '+'
-        print(dividing_line)
-        print('|' + '|'.join([
-            f'{f" {column_alias_dict.get(column_expr, column_expr)}":<{width_list[idx]}}'
-            for idx, column_expr in enumerate(selected_column_expr_list)
-        ]) + '|')
-        print(dividing_line)
-        if merged_record_list:
-            print('\n'.join([
-                '|' + '|'.join([
-                    f'{f" {get_display(record[column_expr])}":<{width_list[idx]}}'
-                    for idx, column_expr in enumerate(selected_column_expr_list)
-                ]) + '|'
-                for record in merged_record_list
-            ]))
-            print(dividing_line)
-
-    def show_tables_query(self, items):
+    def show_tables_query(self, tree):
         # Load the table names
-        table_name_list = self.db_manager.get_table_names()
+        table_name_list = self.db_manager.get_table_names(txn=self.txn)
 
-        # Print the result
-        dividing_line = '-' * max([*map(lambda table_name: len(table_name), table_name_list), 20])
-        print(dividing_line)
-        if table_name_list:
-            print('\n'.join(table_name_list))
-        print(dividing_line)
+        # Print the result (Written at once, instead of printing line by line)
+        dividing_line = '-' * max(max(map(len, table_name_list), default=0), 20)
+        self.out.write('\n'.join([dividing_line, *table_name_list, dividing_line]) + '\n')
 
-    def update_query(self, items):
+    def update_query(self, tree):
         pass
 
-    def exit_query(self, items):
+    def exit_query(self, tree):
         # Skip the remaining queries and terminate this process
         exit(0)